@@ -0,0 +1,87 @@
+"""
+Asynchronous audio file access for the audio processors.
+
+Reads go through aiofiles so many concurrent tasks can wait on disk I/O
+without blocking the event loop.
+"""
+
+import io
+import wave
+from pathlib import Path
+
+import aiofiles
+import numpy as np
+
+
+def resolve_audio_path(audio_dir: str | Path, file_name: str) -> Path:
+    """
+    Resolve a requested file name inside the audio directory.
+
+    Args:
+        audio_dir: Directory holding the audio files
+        file_name: File name from the processing request
+
+    Returns:
+        Absolute path of the audio file
+
+    Raises:
+        ValueError: If the file name points outside the audio directory
+    """
+    base = Path(audio_dir).resolve()
+    path = (base / file_name).resolve()
+    if not path.is_relative_to(base):
+        raise ValueError(f"Audio file {file_name!r} is outside the audio directory")
+    return path
+
+
+async def read_audio(path: str | Path) -> bytes:
+    """
+    Read an audio file without blocking the event loop.
+
+    Args:
+        path: Path of the audio file
+
+    Returns:
+        Raw file contents
+    """
+    async with aiofiles.open(path, "rb") as f:
+        return await f.read()
+
+
+def decode_wav(data: bytes) -> np.ndarray:
+    """
+    Decode 16-bit PCM WAV data into stereo float32 samples.
+
+    Mono files are duplicated into both channels.
+
+    Args:
+        data: Raw WAV file contents
+
+    Returns:
+        Array of shape (N, 2) with samples scaled to [-1.0, 1.0)
+
+    Raises:
+        ValueError: If the data is not non-empty 16-bit mono or stereo PCM WAV
+    """
+    try:
+        with wave.open(io.BytesIO(data), "rb") as wav:
+            channels = wav.getnchannels()
+            sample_width = wav.getsampwidth()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError) as e:
+        raise ValueError(f"Invalid WAV data: {e}") from e
+
+    if sample_width != 2 or channels not in (1, 2):
+        raise ValueError(
+            f"Unsupported WAV format: {channels} channel(s), {8 * sample_width}-bit "
+            "(expected 16-bit mono or stereo PCM)"
+        )
+
+    if not frames:
+        raise ValueError("WAV data contains no samples")
+
+    samples = np.frombuffer(frames, dtype="<i2").reshape(-1, channels)
+    samples = samples.astype(np.float32) / 32768.0
+    if channels == 1:
+        samples = np.repeat(samples, 2, axis=1)
+    return samples
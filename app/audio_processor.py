@@ -7,17 +7,134 @@ ignoring the motion parameter due to incorrect boolean parsing.
 
 import asyncio
 import logging
-from typing import Dict, Any
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Optional: install the "jit" extra for the compiled kernel
+    numba = None
+
+from app.audio_io import decode_wav, read_audio, resolve_audio_path
+from app.config import settings
+from app.models import AudioProcessingResult
 
 logger = logging.getLogger(__name__)
 
+# Channel gains (left, right) of the fixed implementation at unit volume
+_MOTION_GAINS = (0.45, 0.55)  # Stereo panning: left slightly lower, right slightly higher
+_FLAT_GAINS = (0.5, 0.5)
+
+
+async def _load_samples(file_name: str) -> np.ndarray | None:
+    """
+    Read and decode an audio file from the configured audio directory.
+
+    Returns None when no audio directory is configured, after simulating the I/O delay.
+    Errors name only the requested file, never the server-side path, since task errors
+    are returned to clients.
+
+    Raises:
+        ValueError: If the file is missing, unreadable or not a supported WAV file
+    """
+    if settings.audio_dir is None:
+        # Simulate audio processing delay
+        await asyncio.sleep(settings.processing_delay)
+        return None
+
+    try:
+        data = await read_audio(resolve_audio_path(settings.audio_dir, file_name))
+    except FileNotFoundError:
+        raise ValueError(f"Audio file {file_name!r} not found") from None
+    except OSError:
+        raise ValueError(f"Audio file {file_name!r} could not be read") from None
+    # Decoding is CPU-bound; keep it off the event loop
+    return await asyncio.to_thread(decode_wav, data)
+
+
+if numba is not None:
+    # Serial on purpose: asyncio.to_thread already runs one kernel per file
+    # concurrently, and parallel=True kernels launched from worker threads hang
+    # the interpreter at exit. The explicit signature compiles the kernel at
+    # import time instead of on the first real-audio request.
+    @numba.njit(
+        "UniTuple(float64, 2)(float32[:, :], float32, float32)",
+        nogil=True,
+        fastmath=True,
+        cache=True
+    )
+    def _channel_abs_sums(samples, left_gain, right_gain):
+        """Sum the absolute gained amplitudes of both channels in a single pass."""
+        left = 0.0
+        right = 0.0
+        for i in range(samples.shape[0]):
+            left += abs(samples[i, 0] * left_gain)
+            right += abs(samples[i, 1] * right_gain)
+        return left, right
+else:
+    _channel_abs_sums = None
+
+
+def _channel_levels(samples: np.ndarray, gains: np.ndarray) -> tuple[float, float]:
+    """
+    Apply per-channel gains to a stereo buffer and measure the average amplitudes.
+
+    Uses the compiled Numba kernel when numba is installed, which needs no
+    intermediate buffer; otherwise falls back to NumPy.
+
+    Args:
+        samples: float32 samples of shape (N, 2)
+        gains: float32 gains of shape (2,) for the left and right channel
+
+    Returns:
+        Average absolute amplitude of the left and right output channel
+    """
+    if _channel_abs_sums is not None:
+        samples = np.asarray(samples, dtype=np.float32)
+        left, right = _channel_abs_sums(samples, np.float32(gains[0]), np.float32(gains[1]))
+        return left / len(samples), right / len(samples)
+
+    out = samples * gains
+    np.abs(out, out=out)
+    left, right = out.mean(axis=0)
+    return float(left), float(right)
+
+
+def _log_result(implementation: str, motion: bool, result: AudioProcessingResult) -> None:
+    """
+    Emit a structured DEBUG record for a processed file.
+
+    Tasks report the result in their INFO task_completed record; this one
+    adds the type the motion flag arrived with.
+
+    Args:
+        implementation: Processor that produced the result ("buggy" or "fixed")
+        motion: Motion flag as received, logged with its type for debugging
+        result: Processing result
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug(
+        "audio_processed",
+        extra={
+            "implementation": implementation,
+            "file_name": result.file_name,
+            "motion": motion,
+            "motion_type": type(motion).__name__,
+            "motion_applied": result.motion_applied,
+            "left_channel": result.left_channel_avg,
+            "right_channel": result.right_channel_avg,
+            "channels_differ": result.channels_differ
+        }
+    )
+
 
 async def process_audio_buggy(
     file_name: str,
     motion: bool,
     volume: float,
     format: str
-) -> Dict[str, Any]:
+) -> AudioProcessingResult:
     """
     BUGGY IMPLEMENTATION: Ignores motion parameter due to incorrect parsing.
 
@@ -27,6 +144,9 @@ async def process_audio_buggy(
     Real-world scenario: A client uploads audio files and requests stereo panning
     (motion effect), but always receives identical stereo channels.
 
+    File I/O is always simulated here, even when an audio directory is configured;
+    only the fixed implementation reads real files.
+
     Args:
         file_name: Name of the audio file
         motion: Should apply motion effect (but gets ignored due to bug)
@@ -34,12 +154,10 @@ async def process_audio_buggy(
         format: Output audio format
 
     Returns:
-        Dict containing processing results with identical channel values
+        Processing result with identical channel values
     """
-    logger.info(f"[BUGGY] Processing {file_name} with motion={motion}")
-
     # Simulate audio processing delay
-    await asyncio.sleep(0.1)
+    await asyncio.sleep(settings.processing_delay)
 
     # BUG: Incorrect boolean check - this always evaluates to False
     # In real scenarios, this might be caused by:
@@ -52,21 +170,20 @@ async def process_audio_buggy(
         right_channel = 0.6 * volume  # This code path never executes
     else:
         # Always executes - produces identical channels
-        logger.info("[BUGGY] Motion effect NOT applied (bug present)")
         left_channel = 0.5 * volume
         right_channel = 0.5 * volume  # Identical to left channel
 
-    result = {
-        "file_name": file_name,
-        "motion_applied": False,  # Always False due to bug
-        "left_channel_avg": left_channel,
-        "right_channel_avg": right_channel,
-        "channels_differ": left_channel != right_channel,
-        "volume": volume,
-        "format": format
-    }
-
-    logger.info(f"[BUGGY] Result: L={left_channel}, R={right_channel}, differ={result['channels_differ']}")
+    result = AudioProcessingResult(
+        file_name=file_name,
+        motion_applied=False,  # Always False due to bug
+        left_channel_avg=left_channel,
+        right_channel_avg=right_channel,
+        channels_differ=left_channel != right_channel,
+        volume=volume,
+        format=format
+    )
+
+    _log_result("buggy", motion, result)
     return result
 
 
@@ -74,8 +191,9 @@ async def process_audio_fixed(
     file_name: str,
     motion: bool,
     volume: float,
-    format: str
-) -> Dict[str, Any]:
+    format: str,
+    samples: np.ndarray | None = None
+) -> AudioProcessingResult:
     """
     FIXED IMPLEMENTATION: Correctly handles motion parameter as boolean.
 
@@ -92,41 +210,49 @@ async def process_audio_fixed(
         motion: Apply motion effect (stereo panning)
         volume: Volume adjustment multiplier
         format: Output audio format
+        samples: Already decoded float32 samples of shape (N, 2); read from
+            the audio directory when omitted
 
     Returns:
-        Dict containing processing results with different channel values when motion=True
+        Processing result with different channel values when motion=True
     """
-    logger.info(f"[FIXED] Processing {file_name} with motion={motion} (type: {type(motion)})")
-
-    # Simulate audio processing delay
-    await asyncio.sleep(0.1)
+    if samples is None:
+        # Read the audio file (I/O is simulated when no audio directory is configured)
+        samples = await _load_samples(file_name)
 
     # FIX: Correct boolean check
     if motion:  # Proper boolean comparison
         # Apply motion effect - create stereo panning
-        logger.info("[FIXED] Applying motion effect - stereo panning")
-        left_channel = 0.45 * volume  # Left channel slightly lower
-        right_channel = 0.55 * volume  # Right channel slightly higher
+        left_gain, right_gain = _MOTION_GAINS
         motion_applied = True
     else:
         # No motion - keep channels identical
-        logger.info("[FIXED] No motion effect requested")
-        left_channel = 0.5 * volume
-        right_channel = 0.5 * volume
+        left_gain, right_gain = _FLAT_GAINS
         motion_applied = False
 
-    result = {
-        "file_name": file_name,
-        "motion_applied": motion_applied,
-        "left_channel_avg": left_channel,
-        "right_channel_avg": right_channel,
-        "channels_differ": left_channel != right_channel,
-        "volume": volume,
-        "format": format
-    }
-
-    logger.info(
-        f"[FIXED] Result: L={left_channel:.2f}, R={right_channel:.2f}, "
-        f"differ={result['channels_differ']}, motion_applied={motion_applied}"
+    # Unit volume (the default) needs no scaling
+    if volume != 1.0:
+        left_gain *= volume
+        right_gain *= volume
+
+    if samples is None:
+        # The simulated signal has unit level on both channels
+        left_channel, right_channel = left_gain, right_gain
+    else:
+        gains = np.array([left_gain, right_gain], dtype=np.float32)
+        # NumPy and the Numba kernel release the GIL, so files are processed
+        # in parallel while the event loop keeps serving other requests
+        left_channel, right_channel = await asyncio.to_thread(_channel_levels, samples, gains)
+
+    result = AudioProcessingResult(
+        file_name=file_name,
+        motion_applied=motion_applied,
+        left_channel_avg=left_channel,
+        right_channel_avg=right_channel,
+        channels_differ=left_channel != right_channel,
+        volume=volume,
+        format=format
     )
+
+    _log_result("fixed", motion, result)
     return result
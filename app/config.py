@@ -0,0 +1,44 @@
+"""
+Application settings loaded from environment variables or a .env file.
+"""
+
+import logging
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pythonjsonlogger.json import JsonFormatter
+
+
+class Settings(BaseSettings):
+    """
+    Runtime configuration for the API and its background workers.
+
+    Attributes:
+        redis_url: Redis connection URL for the shared task store (in-memory when unset)
+        task_ttl: Seconds a task result is kept before it expires
+        audio_dir: Directory audio files are read from (I/O is simulated when unset)
+        processing_delay: Simulated I/O delay in seconds when no audio directory is set
+        log_level: Root log level for the API and the arq worker
+    """
+    redis_url: str | None = Field(default=None, description="Redis connection URL")
+    task_ttl: int = Field(default=3600, gt=0, description="Task result lifetime in seconds")
+    audio_dir: str | None = Field(default=None, description="Directory holding audio files")
+    processing_delay: float = Field(default=0.1, ge=0.0, description="Simulated I/O delay")
+    log_level: str = Field(default="INFO", description="Root log level")
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+
+settings = Settings()
+
+
+def configure_logging() -> None:
+    """
+    Log one JSON object per record, including `extra` fields, to stderr.
+
+    Called by the API and the arq worker startup; like logging.basicConfig it
+    does nothing if the root logger already has handlers.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter("%(asctime)s %(name)s %(levelname)s %(message)s"))
+    logging.basicConfig(level=settings.log_level.upper(), handlers=[handler])
@@ -0,0 +1,51 @@
+"""
+arq worker for audio processing jobs.
+
+Runs the jobs enqueued by the API when REDIS_URL is configured, in processes
+separate from the HTTP workers:
+
+    arq app.jobs.WorkerSettings
+"""
+
+import logging
+
+from arq.connections import RedisSettings
+
+from app.config import configure_logging, settings
+from app.models import AudioProcessingRequest
+from app.workers import process_audio_task, use_redis_task_store
+
+logger = logging.getLogger(__name__)
+
+
+async def process_audio_job(ctx: dict, request_dict: dict, use_fixed_version: bool = True):
+    """
+    arq job wrapping the audio processing background task.
+
+    Args:
+        ctx: arq job context; the job ID is the task ID
+        request_dict: Serialized audio processing parameters
+        use_fixed_version: If True, use fixed implementation
+    """
+    await process_audio_task(
+        task_id=ctx["job_id"],
+        request=AudioProcessingRequest.model_validate(request_dict),
+        use_fixed_version=use_fixed_version
+    )
+
+
+async def startup(ctx: dict):
+    """Configure logging and store task results through the worker's own arq Redis connection."""
+    if not settings.redis_url:
+        raise RuntimeError("REDIS_URL must be set to run the audio processing worker")
+    configure_logging()
+    use_redis_task_store(ctx["redis"], ttl=settings.task_ttl)
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+    functions = [process_audio_job]
+    on_startup = startup
+    redis_settings = RedisSettings.from_dsn(settings.redis_url or "redis://localhost:6379")
+    # Task results are kept in the task store, not as arq job results
+    keep_result = 0
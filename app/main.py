@@ -7,16 +7,24 @@ ignoring boolean parameters due to incorrect type handling.
 
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, BackgroundTasks, HTTPException, Query
-from fastapi.responses import JSONResponse
-from app.models import AudioProcessingRequest, AudioProcessingResponse
-from app.workers import create_processing_task, get_task_result
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+from fastapi import FastAPI, BackgroundTasks, HTTPException, Query, Response
+from app.models import (
+    AudioProcessingRequest,
+    AudioProcessingResponse,
+    BatchProcessingRequest,
+    BatchProcessingResponse,
+    TaskStatus,
 )
+from app.config import configure_logging, settings
+from app.workers import (
+    close_task_backend,
+    create_processing_task,
+    get_task_payload,
+    open_task_backend,
+    process_audio_batch,
+)
+
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +32,9 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown events."""
     logger.info("Starting FastAPI Worker Motion Fix application")
+    await open_task_backend(settings.redis_url, ttl=settings.task_ttl)
     yield
+    await close_task_backend()
     logger.info("Shutting down FastAPI Worker Motion Fix application")
 
 
@@ -50,6 +60,7 @@ async def root():
             "docs": "/docs",
             "health": "/health",
             "process_audio": "/process-audio",
+            "process_audio_batch": "/process-audio/batch",
             "task_result": "/task/{task_id}"
         }
     }
@@ -93,49 +104,98 @@ async def process_audio(
     Task ID for checking processing results via `/task/{task_id}`
     """
     try:
-        task_id = create_processing_task(
+        task_id = await create_processing_task(
             background_tasks=background_tasks,
             request=request,
             use_fixed_version=use_fixed
         )
 
         implementation = "fixed" if use_fixed else "buggy"
-        logger.info(
-            f"Created audio processing task {task_id} for {request.file_name} "
-            f"using {implementation} implementation"
-        )
 
         return AudioProcessingResponse(
             task_id=task_id,
-            status="processing",
+            status="queued",
             file_name=request.file_name,
-            message=f"Audio processing started in background ({implementation} version)"
+            message=f"Audio processing queued ({implementation} version)"
         )
 
     except Exception as e:
-        logger.error(f"Failed to create processing task: {str(e)}", exc_info=True)
+        logger.error("Failed to create processing task: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/task/{task_id}", tags=["Audio Processing"])
+@app.post(
+    "/process-audio/batch",
+    response_model=BatchProcessingResponse,
+    response_model_exclude_none=True,
+    tags=["Audio Processing"]
+)
+async def process_audio_batch_endpoint(
+    request: BatchProcessingRequest,
+    use_fixed: bool = Query(
+        True,
+        description="Use fixed implementation (True) or buggy implementation (False)"
+    )
+):
+    """
+    Process several audio files in one request and return their results inline.
+
+    Up to 100 files per batch are processed concurrently, at most `max_concurrent` at a time.
+    A file that fails is reported with `status="failed"` without aborting the batch.
+
+    **Returns:**
+    One result per requested file, in request order
+    """
+    results = await process_audio_batch(
+        request.items,
+        use_fixed_version=use_fixed,
+        max_concurrent=request.max_concurrent
+    )
+
+    logger.info(
+        "batch_processed",
+        extra={
+            "implementation": "fixed" if use_fixed else "buggy",
+            "files": len(results),
+            "failed": sum(1 for r in results if r.status == "failed")
+        }
+    )
+
+    return BatchProcessingResponse(results=results)
+
+
+@app.get(
+    "/task/{task_id}",
+    response_model=TaskStatus,
+    tags=["Audio Processing"]
+)
 async def get_task_status(task_id: str):
     """
     Get the status and result of a processing task.
 
     **Response includes:**
-    - Task status (processing, completed, failed)
+    - Task status (queued, processing, completed, failed)
     - Processing result with channel information
     - Whether motion effect was applied
     - Channel difference validation
+
+    **Queued tasks:**
+    A task has no stored status until a worker starts it and is reported as `queued`
+    until then. With the arq queue (REDIS_URL set), a task ID arq does not know returns
+    404. Without it, any well-formed task ID without a stored status is reported as
+    `queued`, including tasks that expired after TASK_TTL or were evicted from the
+    in-memory store, so clients should stop polling after a timeout.
     """
-    result = get_task_result(task_id)
+    payload = await get_task_payload(task_id)
 
-    if result is None:
+    if payload is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return JSONResponse(content=result)
+    # The store already holds the serialized response; send it as-is
+    return Response(content=payload, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools ship with uvicorn[standard]
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
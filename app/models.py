@@ -50,10 +50,10 @@ class AudioProcessingResponse(BaseModel):
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
-                "task_id": "550e8400-e29b-41d4-a716-446655440000",
-                "status": "processing",
+                "task_id": "550e8400e29b41d4a716446655440000",
+                "status": "queued",
                 "file_name": "podcast_episode_001.wav",
-                "message": "Audio processing started in background"
+                "message": "Audio processing queued (fixed version)"
             }
         }
     )
@@ -93,3 +93,55 @@ class AudioProcessingResult(BaseModel):
             }
         }
     )
+
+
+class TaskStatus(BaseModel):
+    """
+    Status and outcome of a single audio processing task.
+
+    Attributes:
+        status: Task status (queued, processing, completed, failed)
+        file_name: File being processed (set while processing)
+        result: Processing result once completed
+        error: Error message if the task failed
+    """
+    status: str
+    file_name: str | None = None
+    result: AudioProcessingResult | None = None
+    error: str | None = None
+
+
+class BatchProcessingRequest(BaseModel):
+    """
+    Request model for the batch audio processing endpoint.
+
+    Attributes:
+        items: Audio files to process (1 to 100)
+        max_concurrent: Maximum number of files processed at the same time
+    """
+    items: list[AudioProcessingRequest] = Field(
+        ..., min_length=1, max_length=100, description="Files to process (at most 100)"
+    )
+    max_concurrent: int = Field(default=8, ge=1, le=64, description="Concurrency limit")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {"file_name": "podcast_episode_001.wav", "motion": True},
+                    {"file_name": "podcast_episode_002.wav", "motion": False}
+                ],
+                "max_concurrent": 8
+            }
+        }
+    )
+
+
+class BatchProcessingResponse(BaseModel):
+    """
+    Response model for the batch audio processing endpoint.
+
+    Attributes:
+        results: One task status per requested file, in request order
+    """
+    results: list[TaskStatus]
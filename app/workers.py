@@ -2,17 +2,135 @@
 Background workers for audio processing tasks.
 """
 
-import uuid
+import asyncio
 import logging
+import uuid
+
+import redis.asyncio as aioredis
+from arq import create_pool
+from arq.connections import ArqRedis, RedisSettings
+from arq.jobs import Job, JobStatus
+from cachetools import TTLCache
 from fastapi import BackgroundTasks
+
 from app.audio_processor import process_audio_buggy, process_audio_fixed
-from app.models import AudioProcessingRequest, AudioProcessingResult
+from app.models import AudioProcessingRequest, AudioProcessingResult, TaskStatus
 
 logger = logging.getLogger(__name__)
 
-# In-memory storage for demo purposes
-# In production, use Redis, database, or message queue
-processing_results = {}
+
+class InMemoryTaskStore:
+    """
+    Per-process task store used when no Redis URL is configured.
+
+    Only suitable for a single uvicorn worker: other processes cannot see its entries.
+    At most ``maxsize`` entries are kept, each for ``ttl`` seconds, so memory stays
+    bounded under sustained load.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: int = 3600):
+        self._results = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, task_id: str) -> str | None:
+        return self._results.get(task_id)
+
+    async def set(self, task_id: str, payload: str) -> None:
+        self._results[task_id] = payload
+
+    async def close(self) -> None:
+        self._results.clear()
+
+
+class RedisTaskStore:
+    """
+    Redis-backed task store shared by every API worker process.
+
+    Entries are stored under ``task:<task_id>`` and expire after ``ttl`` seconds.
+    """
+
+    def __init__(self, client: aioredis.Redis, ttl: int):
+        self._redis = client
+        self._ttl = ttl
+
+    async def get(self, task_id: str) -> bytes | None:
+        return await self._redis.get(f"task:{task_id}")
+
+    async def set(self, task_id: str, payload: str) -> None:
+        await self._redis.set(f"task:{task_id}", payload, ex=self._ttl)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+task_store: InMemoryTaskStore | RedisTaskStore = InMemoryTaskStore()
+
+_QUEUED_PAYLOAD = TaskStatus(status="queued").model_dump_json(exclude_none=True)
+
+# arq queue used instead of FastAPI BackgroundTasks when Redis is configured
+job_queue: ArqRedis | None = None
+
+
+async def open_task_backend(redis_url: str | None, ttl: int) -> None:
+    """
+    Select the task store and job queue for this process.
+
+    With a Redis URL, task state is shared through Redis and tasks are enqueued for
+    the arq worker (``arq app.jobs.WorkerSettings``). Without one, tasks run as
+    in-process background tasks and their state stays in memory.
+
+    Args:
+        redis_url: Redis connection URL; the in-memory backend is kept when None
+        ttl: Seconds a task entry is kept
+    """
+    global task_store, job_queue
+    if redis_url:
+        job_queue = await create_pool(RedisSettings.from_dsn(redis_url))
+        task_store = RedisTaskStore(job_queue, ttl=ttl)
+        logger.info("Using Redis task store and arq job queue")
+    else:
+        task_store = InMemoryTaskStore(ttl=ttl)
+        logger.info("Using in-memory task store and background tasks (single worker only)")
+
+
+def use_redis_task_store(client: aioredis.Redis, ttl: int) -> None:
+    """
+    Use an existing Redis connection, such as the arq worker's, as the task store.
+
+    The caller keeps ownership of the connection; no job queue is set up.
+
+    Args:
+        client: Connected Redis client
+        ttl: Seconds a task entry is kept
+    """
+    global task_store
+    task_store = RedisTaskStore(client, ttl=ttl)
+
+
+async def close_task_backend() -> None:
+    """Release the connections held by the task store and job queue."""
+    global job_queue
+    await task_store.close()
+    job_queue = None
+
+
+async def _save_status(task_id: str, status: TaskStatus) -> None:
+    """Serialize a task status once with Pydantic and write it to the task store."""
+    await task_store.set(task_id, status.model_dump_json(exclude_none=True))
+
+
+async def _run_processor(
+    request: AudioProcessingRequest,
+    use_fixed_version: bool
+) -> AudioProcessingResult:
+    """Run the buggy or fixed processor for a single request."""
+    # Choose implementation based on version flag
+    processor = process_audio_fixed if use_fixed_version else process_audio_buggy
+    return await processor(
+        file_name=request.file_name,
+        motion=request.motion,
+        volume=request.volume,
+        format=request.format
+    )
 
 
 async def process_audio_task(
@@ -30,45 +148,84 @@ async def process_audio_task(
         request: Audio processing parameters
         use_fixed_version: If True, use fixed implementation; if False, use buggy version
     """
-    try:
-        logger.info(f"Starting background task {task_id} for {request.file_name}")
-
-        # Choose implementation based on version flag
-        if use_fixed_version:
-            result_dict = await process_audio_fixed(
-                file_name=request.file_name,
-                motion=request.motion,
-                volume=request.volume,
-                format=request.format
-            )
-        else:
-            result_dict = await process_audio_buggy(
-                file_name=request.file_name,
-                motion=request.motion,
-                volume=request.volume,
-                format=request.format
-            )
+    # Until a worker starts the task it has no entry and is reported as queued
+    await _save_status(task_id, TaskStatus(status="processing", file_name=request.file_name))
 
-        # Convert to Pydantic model for validation
-        result = AudioProcessingResult(**result_dict)
+    try:
+        result = await _run_processor(request, use_fixed_version)
 
         # Store result for retrieval
-        processing_results[task_id] = {
-            "status": "completed",
-            "result": result.model_dump()
-        }
+        await _save_status(task_id, TaskStatus(status="completed", result=result))
 
-        logger.info(f"Task {task_id} completed successfully")
+        # The one INFO record per task; creation and processor records are DEBUG
+        logger.info(
+            "task_completed",
+            extra={
+                "task_id": task_id,
+                "implementation": "fixed" if use_fixed_version else "buggy",
+                "file_name": result.file_name,
+                "motion": request.motion,
+                "motion_applied": result.motion_applied,
+                "left_channel": result.left_channel_avg,
+                "right_channel": result.right_channel_avg,
+                "channels_differ": result.channels_differ
+            }
+        )
 
     except Exception as e:
-        logger.error(f"Task {task_id} failed: {str(e)}", exc_info=True)
-        processing_results[task_id] = {
-            "status": "failed",
-            "error": str(e)
-        }
+        logger.error(
+            "task_failed",
+            extra={"task_id": task_id, "file_name": request.file_name, "error": str(e)},
+            exc_info=True
+        )
+        await _save_status(task_id, TaskStatus(status="failed", error=str(e)))
 
 
-def create_processing_task(
+async def process_audio_batch(
+    requests: list[AudioProcessingRequest],
+    use_fixed_version: bool = True,
+    max_concurrent: int = 8
+) -> list[TaskStatus]:
+    """
+    Process several audio files concurrently and return their results inline.
+
+    At most ``max_concurrent`` files are processed at the same time. A failing file
+    is reported as a failed entry and does not abort the rest of the batch.
+
+    Args:
+        requests: Audio processing parameters, one per file
+        use_fixed_version: If True, use fixed implementation
+        max_concurrent: Maximum number of files processed concurrently
+
+    Returns:
+        One task status per request, in request order
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def process_one(request: AudioProcessingRequest) -> AudioProcessingResult:
+        async with semaphore:
+            return await _run_processor(request, use_fixed_version)
+
+    outcomes = await asyncio.gather(
+        *(process_one(request) for request in requests),
+        return_exceptions=True
+    )
+
+    statuses = []
+    for request, outcome in zip(requests, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(
+                "batch_item_failed",
+                extra={"file_name": request.file_name, "error": str(outcome)}
+            )
+            status = TaskStatus(status="failed", file_name=request.file_name, error=str(outcome))
+        else:
+            status = TaskStatus(status="completed", result=outcome)
+        statuses.append(status)
+    return statuses
+
+
+async def create_processing_task(
     background_tasks: BackgroundTasks,
     request: AudioProcessingRequest,
     use_fixed_version: bool = True
@@ -77,41 +234,90 @@ def create_processing_task(
     Create and queue a new audio processing task.
 
     Args:
-        background_tasks: FastAPI BackgroundTasks instance
+        background_tasks: FastAPI BackgroundTasks instance, used when no job queue is configured
         request: Audio processing parameters
         use_fixed_version: If True, use fixed implementation
 
     Returns:
         Task ID for tracking the task
     """
-    task_id = str(uuid.uuid4())
+    task_id = uuid.uuid4().hex
 
-    # Initialize task status
-    processing_results[task_id] = {
-        "status": "processing",
-        "file_name": request.file_name
-    }
+    if job_queue is not None:
+        # Durable queue: the task survives API restarts and runs in the arq worker
+        await job_queue.enqueue_job(
+            "process_audio_job",
+            request.model_dump(),
+            use_fixed_version,
+            _job_id=task_id
+        )
+    else:
+        # Add to background tasks queue
+        background_tasks.add_task(
+            process_audio_task,
+            task_id=task_id,
+            request=request,
+            use_fixed_version=use_fixed_version
+        )
 
-    # Add to background tasks queue
-    background_tasks.add_task(
-        process_audio_task,
-        task_id=task_id,
-        request=request,
-        use_fixed_version=use_fixed_version
+    logger.debug(
+        "task_created",
+        extra={
+            "task_id": task_id,
+            "file_name": request.file_name,
+            "implementation": "fixed" if use_fixed_version else "buggy",
+            "queue": "arq" if job_queue is not None else "background_tasks"
+        }
     )
-
-    logger.info(f"Created task {task_id} for {request.file_name}")
     return task_id
 
 
-def get_task_result(task_id: str) -> dict:
+def _is_task_id(task_id: str) -> bool:
+    """Check whether a string has the format of the IDs issued by create_processing_task."""
+    try:
+        return uuid.UUID(hex=task_id).hex == task_id
+    except ValueError:
+        return False
+
+
+async def get_task_payload(task_id: str) -> str | bytes | None:
+    """
+    Retrieve the stored JSON of a processing task without decoding it.
+
+    Tasks have no stored entry until a worker starts them, so a task without an entry
+    is reported as queued. With the arq queue, only jobs arq still holds (queued,
+    deferred or just started) count as queued. Without it, any well-formed task ID
+    counts, including tasks that expired or were evicted from the in-memory store.
+
+    Args:
+        task_id: Unique task identifier
+
+    Returns:
+        Serialized task status or None if the task is unknown
+    """
+    payload = await task_store.get(task_id)
+    if payload is not None:
+        return payload
+    if not _is_task_id(task_id):
+        return None
+
+    if job_queue is not None:
+        status = await Job(task_id, job_queue).status()
+        # in_progress covers the moment before the worker writes "processing"
+        if status not in (JobStatus.queued, JobStatus.deferred, JobStatus.in_progress):
+            return None
+    return _QUEUED_PAYLOAD
+
+
+async def get_task_result(task_id: str) -> TaskStatus | None:
     """
-    Retrieve the result of a processing task.
+    Retrieve the status and result of a processing task.
 
     Args:
         task_id: Unique task identifier
 
     Returns:
-        Task result dictionary or None if not found
+        Task status or None if the ID is not a valid task ID
     """
-    return processing_results.get(task_id)
+    payload = await get_task_payload(task_id)
+    return TaskStatus.model_validate_json(payload) if payload is not None else None
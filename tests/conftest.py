@@ -0,0 +1,24 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from app.config import settings
+from app.main import app
+
+
+@pytest.fixture
+def fast_sleep(monkeypatch):
+    """Skip the simulated audio I/O delay in processor unit tests."""
+    monkeypatch.setattr(settings, "processing_delay", 0.0)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client():
+    """HTTP client for the API, shared by all tests in a module."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
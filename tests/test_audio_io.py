@@ -0,0 +1,106 @@
+"""
+Tests for asynchronous audio file reading and decoding.
+"""
+
+import wave
+
+import numpy as np
+import pytest
+
+from app.audio_io import decode_wav, read_audio, resolve_audio_path
+from app.audio_processor import process_audio_fixed
+from app.config import settings
+
+
+def write_wav(path, samples: np.ndarray, channels: int = 2):
+    """Write int16 samples to a PCM WAV file."""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(44100)
+        wav.writeframes(samples.astype("<i2").tobytes())
+
+
+@pytest.mark.asyncio
+class TestAudioIO:
+    """Test suite for reading audio files."""
+
+    async def test_read_and_decode_stereo_wav(self, tmp_path):
+        """Test that a stereo WAV file is decoded into (N, 2) float32 samples."""
+        path = tmp_path / "stereo.wav"
+        write_wav(path, np.array([[16384, -16384], [8192, -8192]]))
+
+        samples = decode_wav(await read_audio(path))
+
+        assert samples.dtype == np.float32
+        assert samples.shape == (2, 2)
+        assert samples[0, 0] == 0.5
+        assert samples[0, 1] == -0.5
+
+    async def test_decode_mono_wav_duplicates_channel(self, tmp_path):
+        """Test that mono files are decoded into identical left/right channels."""
+        path = tmp_path / "mono.wav"
+        write_wav(path, np.array([16384, 8192, 0]), channels=1)
+
+        samples = decode_wav(await read_audio(path))
+
+        assert samples.shape == (3, 2)
+        assert np.array_equal(samples[:, 0], samples[:, 1])
+
+    async def test_decode_rejects_invalid_data(self):
+        """Test that non-WAV data is rejected."""
+        with pytest.raises(ValueError):
+            decode_wav(b"not a wav file")
+
+    async def test_resolve_rejects_path_outside_audio_dir(self, tmp_path):
+        """Test that request file names cannot escape the audio directory."""
+        assert resolve_audio_path(tmp_path, "song.wav") == (tmp_path / "song.wav").resolve()
+        with pytest.raises(ValueError):
+            resolve_audio_path(tmp_path, "../secret.wav")
+
+    async def test_fixed_implementation_reads_audio_dir(self, tmp_path, monkeypatch):
+        """Test that channel averages are measured from the file when audio_dir is set."""
+        write_wav(tmp_path / "half.wav", np.full((4, 2), 16384))
+        monkeypatch.setattr(settings, "audio_dir", str(tmp_path))
+
+        result = await process_audio_fixed(
+            file_name="half.wav",
+            motion=True,
+            volume=1.0,
+            format="wav"
+        )
+
+        assert result.left_channel_avg == pytest.approx(0.45 * 0.5)
+        assert result.right_channel_avg == pytest.approx(0.55 * 0.5)
+        assert result.channels_differ is True
+
+    async def test_missing_file_error_hides_audio_dir(self, tmp_path, monkeypatch):
+        """Test that a missing file is reported by name without the server-side path."""
+        monkeypatch.setattr(settings, "audio_dir", str(tmp_path))
+
+        with pytest.raises(ValueError) as exc_info:
+            await process_audio_fixed(
+                file_name="missing.wav",
+                motion=True,
+                volume=1.0,
+                format="wav"
+            )
+
+        assert "missing.wav" in str(exc_info.value)
+        assert str(tmp_path) not in str(exc_info.value)
+
+    async def test_fixed_implementation_with_decoded_samples(self):
+        """Test that per-channel gains are applied to a caller-provided buffer."""
+        samples = np.array([[1.0, -1.0], [-0.5, 0.5]], dtype=np.float32)
+
+        result = await process_audio_fixed(
+            file_name="buffer.wav",
+            motion=True,
+            volume=2.0,
+            format="wav",
+            samples=samples
+        )
+
+        assert result.left_channel_avg == pytest.approx(0.45 * 2.0 * 0.75)
+        assert result.right_channel_avg == pytest.approx(0.55 * 2.0 * 0.75)
+        assert samples[0, 0] == 1.0, "Input buffer must not be modified"
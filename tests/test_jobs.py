@@ -0,0 +1,59 @@
+"""
+Tests for the arq audio processing job.
+"""
+
+import logging
+
+import fakeredis
+import pytest
+from pythonjsonlogger.json import JsonFormatter
+
+from app import workers
+from app.config import settings
+from app.jobs import process_audio_job, startup
+from app.workers import RedisTaskStore, get_task_result
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("fast_sleep")
+class TestAudioProcessingJob:
+    """Test suite for the queued audio processing job."""
+
+    async def test_job_stores_result_under_job_id(self):
+        """Test that the job stores its result under the arq job ID."""
+        await process_audio_job(
+            {"job_id": "job-motion-true"},
+            {"file_name": "queued.wav", "motion": True, "volume": 1.0, "format": "wav"},
+            True
+        )
+
+        task = await get_task_result("job-motion-true")
+        assert task.status == "completed"
+        assert task.result.file_name == "queued.wav"
+        assert task.result.channels_differ is True
+
+    async def test_startup_uses_worker_redis_connection(self, monkeypatch):
+        """Test that the worker stores results through arq's own Redis connection."""
+        monkeypatch.setattr(settings, "redis_url", "redis://localhost:6379/0")
+        monkeypatch.setattr(workers, "task_store", workers.task_store)
+        redis = fakeredis.FakeAsyncRedis()
+
+        await startup({"redis": redis})
+
+        assert isinstance(workers.task_store, RedisTaskStore)
+        await workers.task_store.set("task-1", '{"status":"processing"}')
+        assert await redis.get("task:task-1") == b'{"status":"processing"}'
+        assert workers.job_queue is None
+
+    async def test_startup_configures_json_logging(self, monkeypatch):
+        """Test that the worker logs JSON records like the API, without importing app.main."""
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", [])
+        monkeypatch.setattr(root, "level", root.level)
+        monkeypatch.setattr(settings, "redis_url", "redis://localhost:6379/0")
+        monkeypatch.setattr(workers, "task_store", workers.task_store)
+
+        await startup({"redis": fakeredis.FakeAsyncRedis()})
+
+        assert any(isinstance(h.formatter, JsonFormatter) for h in root.handlers)
+        assert root.level == logging.INFO
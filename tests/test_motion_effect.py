@@ -7,13 +7,17 @@ This test suite validates that:
 3. Both implementations work correctly when motion=False
 """
 
+import logging
+
+import numpy as np
 import pytest
-from httpx import AsyncClient, ASGITransport
-from app.main import app
+
+from app import audio_processor
 from app.audio_processor import process_audio_buggy, process_audio_fixed
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("fast_sleep")
 class TestMotionEffectBug:
     """Test suite for motion effect bug demonstration."""
 
@@ -34,11 +38,11 @@ class TestMotionEffectBug:
         )
 
         # Buggy implementation ignores motion, so channels are identical
-        assert result["motion_applied"] is False, \
+        assert result.motion_applied is False, \
             "Buggy version should report motion NOT applied"
-        assert result["left_channel_avg"] == result["right_channel_avg"], \
+        assert result.left_channel_avg == result.right_channel_avg, \
             "Buggy version produces identical channels even with motion=True"
-        assert result["channels_differ"] is False, \
+        assert result.channels_differ is False, \
             "Buggy version channels should not differ"
 
     async def test_buggy_implementation_motion_false(self):
@@ -56,9 +60,9 @@ class TestMotionEffectBug:
             format="wav"
         )
 
-        assert result["motion_applied"] is False
-        assert result["left_channel_avg"] == result["right_channel_avg"]
-        assert result["channels_differ"] is False
+        assert result.motion_applied is False
+        assert result.left_channel_avg == result.right_channel_avg
+        assert result.channels_differ is False
 
     async def test_fixed_implementation_applies_motion_true(self):
         """
@@ -77,15 +81,15 @@ class TestMotionEffectBug:
         )
 
         # Fixed implementation applies motion effect
-        assert result["motion_applied"] is True, \
+        assert result.motion_applied is True, \
             "Fixed version should report motion applied"
-        assert result["left_channel_avg"] != result["right_channel_avg"], \
+        assert result.left_channel_avg != result.right_channel_avg, \
             "Fixed version produces different channels with motion=True"
-        assert result["channels_differ"] is True, \
+        assert result.channels_differ is True, \
             "Fixed version channels should differ when motion=True"
 
         # Verify stereo panning (left < right in this implementation)
-        assert result["left_channel_avg"] < result["right_channel_avg"], \
+        assert result.left_channel_avg < result.right_channel_avg, \
             "Motion effect should create stereo panning (left < right)"
 
     async def test_fixed_implementation_motion_false(self):
@@ -103,9 +107,9 @@ class TestMotionEffectBug:
             format="wav"
         )
 
-        assert result["motion_applied"] is False
-        assert result["left_channel_avg"] == result["right_channel_avg"]
-        assert result["channels_differ"] is False
+        assert result.motion_applied is False
+        assert result.left_channel_avg == result.right_channel_avg
+        assert result.channels_differ is False
 
     async def test_volume_adjustment_both_implementations(self):
         """
@@ -129,114 +133,208 @@ class TestMotionEffectBug:
 
         # Both should apply volume correctly when motion=False
         expected_channel_value = 0.5 * volume
-        assert buggy_result["left_channel_avg"] == expected_channel_value
-        assert buggy_result["right_channel_avg"] == expected_channel_value
-        assert fixed_result["left_channel_avg"] == expected_channel_value
-        assert fixed_result["right_channel_avg"] == expected_channel_value
+        assert buggy_result.left_channel_avg == expected_channel_value
+        assert buggy_result.right_channel_avg == expected_channel_value
+        assert fixed_result.left_channel_avg == expected_channel_value
+        assert fixed_result.right_channel_avg == expected_channel_value
+
+    async def test_fixed_implementation_logs_one_record(self, caplog):
+        """Test that processing a file emits a single structured DEBUG record."""
+        with caplog.at_level(logging.DEBUG, logger="app.audio_processor"):
+            await process_audio_fixed(
+                file_name="test_audio.wav",
+                motion=True,
+                volume=1.0,
+                format="wav"
+            )
+
+        records = [r for r in caplog.records if r.name == "app.audio_processor"]
+        assert len(records) == 1
+        assert records[0].getMessage() == "audio_processed"
+        assert records[0].levelno == logging.DEBUG
+        assert records[0].motion_type == "bool"
+        assert records[0].channels_differ is True
 
 
 @pytest.mark.asyncio
+class TestChannelLevels:
+    """Test suite for the channel level kernel used on decoded sample buffers."""
+
+    async def test_jit_kernel_matches_numpy(self, monkeypatch):
+        """Test that the Numba kernel and the NumPy fallback measure the same levels."""
+        pytest.importorskip("numba")
+        samples = np.random.default_rng(0).uniform(-1.0, 1.0, (1000, 2)).astype(np.float32)
+        gains = np.array([0.45, 0.55], dtype=np.float32)
+
+        jit_levels = audio_processor._channel_levels(samples, gains)
+        monkeypatch.setattr(audio_processor, "_channel_abs_sums", None)
+        numpy_levels = audio_processor._channel_levels(samples, gains)
+
+        assert jit_levels == pytest.approx(numpy_levels, rel=1e-5)
+
+    async def test_jit_kernel_through_event_loop(self):
+        """Test that the Numba kernel runs from the processor's worker thread."""
+        pytest.importorskip("numba")
+        assert audio_processor._channel_abs_sums is not None
+        samples = np.full((1000, 2), 0.5, dtype=np.float32)
+
+        result = await process_audio_fixed(
+            file_name="buffer.wav",
+            motion=True,
+            volume=1.0,
+            format="wav",
+            samples=samples
+        )
+
+        assert result.left_channel_avg == pytest.approx(0.45 * 0.5)
+        assert result.right_channel_avg == pytest.approx(0.55 * 0.5)
+
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestAudioProcessingAPI:
     """Test suite for FastAPI endpoints."""
 
-    async def test_health_check(self):
+    async def test_health_check(self, client):
         """Test health check endpoint."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/health")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "healthy"
-
-    async def test_root_endpoint(self):
+        response = await client.get("/health")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+
+    async def test_root_endpoint(self, client):
         """Test root endpoint."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/")
-            assert response.status_code == 200
-            data = response.json()
-            assert "version" in data
-            assert "endpoints" in data
-
-    async def test_process_audio_endpoint_fixed_version(self):
+        response = await client.get("/")
+        assert response.status_code == 200
+        data = response.json()
+        assert "version" in data
+        assert "endpoints" in data
+
+    async def test_process_audio_endpoint_fixed_version(self, client):
         """
         Test /process-audio endpoint with fixed implementation.
         """
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/process-audio?use_fixed=true",
-                json={
-                    "file_name": "test_podcast.wav",
-                    "motion": True,
-                    "volume": 1.2,
-                    "format": "mp3"
-                }
-            )
+        response = await client.post(
+            "/process-audio?use_fixed=true",
+            json={
+                "file_name": "test_podcast.wav",
+                "motion": True,
+                "volume": 1.2,
+                "format": "mp3"
+            }
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "task_id" in data
-            assert data["status"] == "processing"
-            assert data["file_name"] == "test_podcast.wav"
-            assert "fixed" in data["message"].lower()
+        assert response.status_code == 200
+        data = response.json()
+        assert "task_id" in data
+        assert data["status"] == "queued"
+        assert data["file_name"] == "test_podcast.wav"
+        assert "fixed" in data["message"].lower()
 
-    async def test_process_audio_endpoint_buggy_version(self):
+    async def test_process_audio_endpoint_buggy_version(self, client):
         """
         Test /process-audio endpoint with buggy implementation.
         """
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/process-audio?use_fixed=false",
-                json={
-                    "file_name": "test_podcast.wav",
-                    "motion": True,
-                    "volume": 1.0,
-                    "format": "wav"
-                }
-            )
+        response = await client.post(
+            "/process-audio?use_fixed=false",
+            json={
+                "file_name": "test_podcast.wav",
+                "motion": True,
+                "volume": 1.0,
+                "format": "wav"
+            }
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "task_id" in data
-            assert data["status"] == "processing"
-            assert "buggy" in data["message"].lower()
+        assert response.status_code == 200
+        data = response.json()
+        assert "task_id" in data
+        assert data["status"] == "queued"
+        assert "buggy" in data["message"].lower()
+
+    async def test_task_result_after_processing(self, client):
+        """Test that a finished task can be retrieved from the task store."""
+        response = await client.post(
+            "/process-audio?use_fixed=true",
+            json={"file_name": "test_podcast.wav", "motion": True}
+        )
+        task_id = response.json()["task_id"]
+
+        response = await client.get(f"/task/{task_id}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["result"]["motion_applied"] is True
+        assert data["result"]["channels_differ"] is True
+
+    async def test_process_audio_batch_endpoint(self, client):
+        """Test /process-audio/batch returns one inline result per file, in order."""
+        response = await client.post(
+            "/process-audio/batch?use_fixed=true",
+            json={
+                "items": [
+                    {"file_name": "first.wav", "motion": True},
+                    {"file_name": "second.wav", "motion": False},
+                    {"file_name": "third.wav", "motion": True, "volume": 2.0}
+                ],
+                "max_concurrent": 2
+            }
+        )
 
-    async def test_invalid_task_id(self):
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["result"]["file_name"] for r in results] == [
+            "first.wav", "second.wav", "third.wav"
+        ]
+        assert all(r["status"] == "completed" for r in results)
+        assert [r["result"]["channels_differ"] for r in results] == [True, False, True]
+
+    async def test_unstarted_task_is_queued(self, client):
+        """Test that a task ID without a stored entry yet is reported as queued."""
+        response = await client.get("/task/550e8400e29b41d4a716446655440000")
+        assert response.status_code == 200
+        assert response.json() == {"status": "queued"}
+
+    async def test_invalid_task_id(self, client):
         """Test retrieving non-existent task returns 404."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/task/nonexistent-task-id")
-            assert response.status_code == 404
+        response = await client.get("/task/nonexistent-task-id")
+        assert response.status_code == 404
 
-    async def test_validation_errors(self):
+    async def test_validation_errors(self, client):
         """Test that invalid requests return validation errors."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            # Missing required file_name field
-            response = await client.post(
-                "/process-audio",
-                json={
-                    "motion": True,
-                    "volume": 1.0
-                }
-            )
-            assert response.status_code == 422  # Validation error
-
-            # Invalid volume (outside range)
-            response = await client.post(
-                "/process-audio",
-                json={
-                    "file_name": "test.wav",
-                    "motion": True,
-                    "volume": 5.0  # Max is 2.0
-                }
-            )
-            assert response.status_code == 422
+        # Missing required file_name field
+        response = await client.post(
+            "/process-audio",
+            json={
+                "motion": True,
+                "volume": 1.0
+            }
+        )
+        assert response.status_code == 422  # Validation error
+
+        # Invalid volume (outside range)
+        response = await client.post(
+            "/process-audio",
+            json={
+                "file_name": "test.wav",
+                "motion": True,
+                "volume": 5.0  # Max is 2.0
+            }
+        )
+        assert response.status_code == 422
+
+        # Empty batch
+        response = await client.post("/process-audio/batch", json={"items": []})
+        assert response.status_code == 422
+
+        # Batch larger than the item limit
+        response = await client.post(
+            "/process-audio/batch",
+            json={"items": [{"file_name": f"file_{i}.wav"} for i in range(101)]}
+        )
+        assert response.status_code == 422
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("fast_sleep")
 class TestBugVsFixComparison:
     """
     Direct comparison tests showing the bug vs fix.
@@ -263,18 +361,18 @@ class TestBugVsFixComparison:
         fixed_result = await process_audio_fixed(**params)
 
         # The bug: buggy version ignores motion
-        assert buggy_result["channels_differ"] is False, \
+        assert buggy_result.channels_differ is False, \
             "BUG: Buggy version has identical channels"
 
         # The fix: fixed version applies motion
-        assert fixed_result["channels_differ"] is True, \
+        assert fixed_result.channels_differ is True, \
             "FIX: Fixed version has different channels"
 
         # Clear demonstration of the fix
         assert (
-            buggy_result["left_channel_avg"] == buggy_result["right_channel_avg"]
+            buggy_result.left_channel_avg == buggy_result.right_channel_avg
         ), "Buggy: L == R (incorrect)"
 
         assert (
-            fixed_result["left_channel_avg"] != fixed_result["right_channel_avg"]
+            fixed_result.left_channel_avg != fixed_result.right_channel_avg
         ), "Fixed: L != R (correct)"
@@ -0,0 +1,142 @@
+"""
+Tests for the background worker task store.
+"""
+
+import logging
+
+import fakeredis
+import pytest
+from arq.connections import ArqRedis
+from fastapi import BackgroundTasks
+
+from app import workers
+from app.models import AudioProcessingRequest
+from app.workers import InMemoryTaskStore, RedisTaskStore
+
+
+@pytest.fixture
+def fake_redis():
+    """arq-compatible Redis client backed by an in-process fake server."""
+    server = fakeredis.FakeServer()
+    return ArqRedis(connection_pool=fakeredis.FakeAsyncRedis(server=server).connection_pool)
+
+
+@pytest.fixture
+def restore_backend(monkeypatch):
+    """Restore the module-level task store and job queue after a test."""
+    monkeypatch.setattr(workers, "task_store", workers.task_store)
+    monkeypatch.setattr(workers, "job_queue", workers.job_queue)
+
+
+@pytest.mark.asyncio
+class TestInMemoryTaskStore:
+    """Test suite for the single-process task store."""
+
+    async def test_store_round_trip(self):
+        """Test that stored payloads are returned unchanged."""
+        store = InMemoryTaskStore()
+        await store.set("task-1", '{"status":"processing"}')
+
+        assert await store.get("task-1") == '{"status":"processing"}'
+        assert await store.get("missing") is None
+
+    async def test_store_is_bounded(self):
+        """Test that the oldest entries are evicted once maxsize is reached."""
+        store = InMemoryTaskStore(maxsize=2)
+        for task_id in ("task-1", "task-2", "task-3"):
+            await store.set(task_id, '{"status":"completed"}')
+
+        assert await store.get("task-1") is None
+        assert await store.get("task-3") is not None
+
+
+@pytest.mark.asyncio
+class TestRedisTaskStore:
+    """Test suite for the shared Redis task store."""
+
+    async def test_store_round_trip(self, fake_redis):
+        """Test that stored payloads are returned from Redis unchanged."""
+        store = RedisTaskStore(fake_redis, ttl=60)
+        await store.set("task-1", '{"status":"processing"}')
+
+        assert await store.get("task-1") == b'{"status":"processing"}'
+        assert await store.get("missing") is None
+
+    async def test_store_sets_key_and_ttl(self, fake_redis):
+        """Test that entries are stored under task:<id> and expire after ttl seconds."""
+        store = RedisTaskStore(fake_redis, ttl=60)
+        await store.set("task-1", '{"status":"completed"}')
+
+        assert await fake_redis.exists("task:task-1")
+        assert 0 < await fake_redis.ttl("task:task-1") <= 60
+
+    @pytest.mark.usefixtures("restore_backend")
+    async def test_open_task_backend_selects_redis(self, fake_redis, monkeypatch):
+        """Test that a Redis URL selects the Redis store and the arq job queue."""
+        async def fake_create_pool(redis_settings):
+            return fake_redis
+
+        monkeypatch.setattr(workers, "create_pool", fake_create_pool)
+        await workers.open_task_backend("redis://localhost:6379/0", ttl=60)
+
+        assert isinstance(workers.task_store, RedisTaskStore)
+        assert workers.job_queue is fake_redis
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("restore_backend")
+class TestJobQueue:
+    """Test suite for queueing tasks on arq."""
+
+    async def test_create_task_enqueues_arq_job(self, fake_redis, monkeypatch):
+        """Test that tasks go to the arq queue, keyed by task ID, instead of BackgroundTasks."""
+        monkeypatch.setattr(workers, "job_queue", fake_redis)
+        background_tasks = BackgroundTasks()
+        request = AudioProcessingRequest(file_name="queued.wav", motion=True)
+
+        task_id = await workers.create_processing_task(
+            background_tasks=background_tasks,
+            request=request,
+            use_fixed_version=False
+        )
+
+        assert background_tasks.tasks == []
+        jobs = await fake_redis.queued_jobs()
+        assert len(jobs) == 1
+        assert jobs[0].job_id == task_id
+        assert jobs[0].function == "process_audio_job"
+        assert jobs[0].args == (request.model_dump(), False)
+
+    async def test_queued_status_comes_from_arq(self, fake_redis, monkeypatch):
+        """Test that only jobs arq still holds are reported as queued."""
+        monkeypatch.setattr(workers, "job_queue", fake_redis)
+        monkeypatch.setattr(workers, "task_store", InMemoryTaskStore())
+        task_id = await workers.create_processing_task(
+            background_tasks=BackgroundTasks(),
+            request=AudioProcessingRequest(file_name="queued.wav")
+        )
+
+        queued = await workers.get_task_result(task_id)
+        assert queued is not None and queued.status == "queued"
+        assert await workers.get_task_payload("550e8400e29b41d4a716446655440000") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("fast_sleep")
+class TestTaskLogging:
+    """Test suite for structured task logging."""
+
+    async def test_task_emits_one_info_record(self, caplog):
+        """Test that a processed task logs a single INFO record carrying its result."""
+        with caplog.at_level(logging.INFO):
+            await workers.process_audio_task(
+                task_id="task-logged",
+                request=AudioProcessingRequest(file_name="logged.wav", motion=True),
+                use_fixed_version=True
+            )
+
+        records = [r for r in caplog.records if r.levelno >= logging.INFO]
+        assert [r.getMessage() for r in records] == ["task_completed"]
+        assert records[0].task_id == "task-logged"
+        assert records[0].implementation == "fixed"
+        assert records[0].channels_differ is True